@@ -1,15 +1,22 @@
 import threading
-import bisect
-from abc import ABC, abstractmethod 
-from collections import deque
+import functools
+import uuid
+import numpy as np
+from sortedcontainers import SortedKeyList
+from abc import ABC, abstractmethod
+from collections import deque, namedtuple
 from django.db import transaction
+from django.db.models import F
+from django.db.utils import OperationalError, ProgrammingError
 from .models import StorageBin, ShipmentLog, Package
+from ._knapsack import knapsack, reconstruct
 
 class StorageUnit(ABC):
     """
     Abstract Base Class for Bins and Trucks.
     Defines the contract for space management.
     """
+    __slots__ = () # Empty so subclasses with __slots__ stay dict-free
 
     @abstractmethod
     def occupy_space(self, amount):
@@ -28,6 +35,8 @@ class InMemoryBin(StorageUnit):
     A lightweight class for the Binary Search Algorithm(For Find best Bin for Package).
     Represents a Bin in the warehouse.
     """
+    __slots__ = ('bin_id', 'capacity', 'location_code', 'is_occupied')
+
     def __init__(self, bin_id, capacity, location_code):
         self.bin_id = bin_id
         self.capacity = capacity
@@ -39,39 +48,57 @@ class InMemoryBin(StorageUnit):
         return self.capacity < other.capacity
 
     def occupy_space(self, amount) -> bool:
-        if self.is_occupied or amount > self.capacity:
-            return False
-        self.is_occupied = True
-        return True
+        # Branchless: no conditional jump in the per-package hot path
+        fits = (not self.is_occupied) and (amount <= self.capacity)
+        self.is_occupied = self.is_occupied or fits
+        return fits
 
     def free_space(self)-> None:
         self.is_occupied = False
 
 
+# Lightweight stack entry: ~4x smaller than a per-item dict
+TruckItem = namedtuple('TruckItem', ['id', 'size'])
+
+
+@functools.lru_cache(maxsize=64)
+def _solve_knapsack(sizes_tuple, capacity):
+    """Memoized knapsack solve: deterministic in (sizes, capacity), so a
+    repeated optimize call (e.g. a page refresh) skips the DP entirely.
+    Cleared whenever a write path changes bin or truck contents."""
+    sizes = np.array(sizes_tuple, dtype=np.int32)
+    return knapsack(sizes, capacity)
+
+
 class Truck(StorageUnit):
     """
     Represents the Delivery Truck.
     Manages a LIFO stack of packages and tracks volume capacity.
     """
+    __slots__ = ('capacity', 'used_space', 'stack', 'id_set')
+
     def __init__(self, capacity=1000):
         self.capacity = capacity
         self.used_space = 0
         self.stack = [] # Follow LIFO Manner as STACK Data Structure
+        self.id_set = set() # Mirrors stack IDs for O(1) membership checks
 
     def occupy_space(self, amount) -> bool:
-        if self.used_space + amount > self.capacity:
-            return False
-        self.used_space += amount
-        return True
+        # Branchless: bool multiplies to 0 or 1, no conditional jump
+        fits = (self.used_space + amount) <= self.capacity
+        self.used_space += amount * fits
+        return fits
 
     def free_space(self) -> None:
         self.stack = []
+        self.id_set = set()
         self.used_space = 0
 
     def load(self, tracking_id, size) -> bool:
         """ Add Data on the top of the stack. """
         if self.occupy_space(size):
-            self.stack.append({'id': tracking_id, 'size': size})
+            self.stack.append(TruckItem(tracking_id, size))
+            self.id_set.add(tracking_id)
             return True
         return False
 
@@ -80,7 +107,8 @@ class Truck(StorageUnit):
         if not self.stack:
             return None
         item = self.stack.pop()
-        self.used_space -= item['size']
+        self.used_space -= item.size
+        self.id_set.discard(item.id)
         return item
 
 class LogiMaster:
@@ -107,15 +135,21 @@ class LogiMaster:
     def reload_inventory(self):
         """Loads bins from SQL and sorts them for O(log N) search."""
         try:
-            db_bins = StorageBin.objects.filter(is_occupied=False).order_by('capacity')
-            self.bin_inventory = [
-                InMemoryBin(b.bin_id, b.capacity, b.location_code) 
-                for b in db_bins
-            ]
-            self.bin_inventory.sort()
-        except:
+            # DB already returns rows sorted by capacity; .values() skips
+            # building full model instances for this read-only snapshot
+            rows = StorageBin.objects.filter(is_occupied=False) \
+                .order_by('capacity') \
+                .values('bin_id', 'capacity', 'location_code')
+            # SortedKeyList keeps O(log n) add/remove as bins churn
+            self.bin_inventory = SortedKeyList(
+                (InMemoryBin(r['bin_id'], r['capacity'], r['location_code'])
+                 for r in rows),
+                key=lambda b: b.capacity
+            )
+        except (OperationalError, ProgrammingError):
+            # Only swallow "DB not ready / migrations not applied"; real errors propagate
             print("Warning: Database tables not ready. Inventory init skipped.")
-            self.bin_inventory = []
+            self.bin_inventory = SortedKeyList(key=lambda b: b.capacity)
 
     def ingest_package(self, size, destination, is_fragile=False):
         """
@@ -138,12 +172,12 @@ class LogiMaster:
         return f"Package {pkg.tracking_id} generated and added to conveyor."
 
     def find_best_fit_bin(self, package_size):
-        """ Find the best fit bin for package size within O(log N) Binary Search. """
-        dummy_search_key = InMemoryBin(None, package_size, None)
-        index = bisect.bisect_left(self.bin_inventory, dummy_search_key)
+        """ Find the best fit bin for package size within O(log N) Binary Search.
+        Returns (index, bin) so callers can pop by index instead of a linear remove. """
+        index = self.bin_inventory.bisect_key_left(package_size)
         if index < len(self.bin_inventory):
-            return self.bin_inventory[index]
-        return None
+            return index, self.bin_inventory[index]
+        return None, None
 
     def process_next_item(self):
         """ Queue implementaion
@@ -153,24 +187,31 @@ class LogiMaster:
         if not self.conveyor_queue: return "Conveyor is empty."
         pkg = self.conveyor_queue[0]
         
-        best_bin = self.find_best_fit_bin(pkg.size)
+        best_index, best_bin = self.find_best_fit_bin(pkg.size)
         if not best_bin:
-            requeued_pkg = self.conveyor_queue.popleft() 
-            self.conveyor_queue.append(requeued_pkg)
+            # Single C-level pointer swap: head moves to tail
+            self.conveyor_queue.rotate(-1)
             return f"No suitable bin found for size {pkg.size}"
 
         try:
             with transaction.atomic():
-                db_bin = StorageBin.objects.select_for_update().get(bin_id=best_bin.bin_id)
-                db_bin.is_occupied = True
-                db_bin.current_tracking_id = pkg.tracking_id
-                db_bin.save()
-                
-                best_bin.occupy_space(pkg.size) 
-                
-                ShipmentLog.objects.create(tracking_id=pkg.tracking_id, bin_id=db_bin.bin_id, status='STORED', details=f"Stored in {db_bin.location_code}")
-                self.conveyor_queue.popleft() 
-                self.bin_inventory.remove(best_bin)
+                # One conditional UPDATE touching only the two changed columns
+                # instead of SELECT ... FOR UPDATE + full-row save()
+                updated = StorageBin.objects.filter(
+                    bin_id=best_bin.bin_id, is_occupied=False
+                ).update(is_occupied=True, current_package_id=pkg.tracking_id)
+
+                if updated != 1:
+                    # Another worker grabbed the bin; drop the stale entry
+                    self.bin_inventory.pop(best_index)
+                    return f"Bin {best_bin.bin_id} was taken by another worker."
+
+                best_bin.occupy_space(pkg.size)
+
+                ShipmentLog.objects.create(tracking_id=pkg.tracking_id, bin_id=best_bin.bin_id, status='STORED', details=f"Stored in {best_bin.location_code}")
+                self.conveyor_queue.popleft()
+                self.bin_inventory.pop(best_index)
+                _solve_knapsack.cache_clear() # Bin contents changed
                 return f"Stored {pkg.tracking_id} in {best_bin.location_code}"
         except Exception as e:
             return f"System Error: {str(e)}"
@@ -182,21 +223,25 @@ class LogiMaster:
         3. EXECUTION: Moves selected packages from Bins -> Truck.
         """
         
-        valid_packages = []
-        
-        occupied_bins = StorageBin.objects.filter(is_occupied=True)
-        
-        for bin_obj in occupied_bins:
-            if bin_obj.current_tracking_id:
-                try:
-                    pkg = Package.objects.get(tracking_id=bin_obj.current_tracking_id)
-                    valid_packages.append({
-                        'tracking_id': pkg.tracking_id,
-                        'size': pkg.size,
-                        'is_fragile': pkg.is_fragile
-                    })
-                except Package.DoesNotExist:
-                    continue
+        # Guard the DP kernel against a missing or non-positive capacity
+        # (the view passes the request body value through unvalidated)
+        if not truck_capacity or truck_capacity <= 0:
+            return {
+                "size": 0,
+                "selection": [],
+                "execution_logs": ["Truck capacity must be a positive number."]
+            }
+
+        # Single JOIN through the current_package FK instead of one
+        # Package query per occupied bin (N+1)
+        valid_packages = list(
+            StorageBin.objects.filter(is_occupied=True, current_package__isnull=False)
+            .values(
+                tracking_id=F('current_package__tracking_id'),
+                size=F('current_package__size'),
+                is_fragile=F('current_package__is_fragile'),
+            )
+        )
 
         if not valid_packages:
             return {
@@ -208,82 +253,112 @@ class LogiMaster:
         fragile = [p for p in valid_packages if p.get('is_fragile', False)]
         standard = [p for p in valid_packages if not p.get('is_fragile', False)]
 
+        # SoA: pull the sizes into one contiguous array up front so the
+        # DP below runs over pure int32 memory
+        std_sizes = np.array([p['size'] for p in standard], dtype=np.int32)
+
         fragile_total_size = sum(p['size'] for p in fragile)
-        
+        std_total_size = int(std_sizes.sum())
+
         best_scenario = {"size": 0, "selection": []}
 
-        if fragile_total_size > 0 and fragile_total_size <= truck_capacity:
-            remaining_cap = truck_capacity - fragile_total_size
-            best_std_size, best_std_pkg = self._find_max_subset(remaining_cap, standard)
-            
-            total_size_1 = fragile_total_size + best_std_size
-            selection_1 = fragile + best_std_pkg
-            
-            if total_size_1 > best_scenario["size"]:
-                best_scenario = {"size": total_size_1, "selection": selection_1}
-
-        best_std_size_only, best_std_pkg_only = self._find_max_subset(truck_capacity, standard)
-        
-        if best_std_size_only > best_scenario["size"]:
-            best_scenario = {"size": best_std_size_only, "selection": best_std_pkg_only}
+        if fragile_total_size + std_total_size <= truck_capacity:
+            # Trivial case: everything fits, no knapsack needed
+            best_scenario = {
+                "size": fragile_total_size + std_total_size,
+                "selection": fragile + standard
+            }
+        else:
+            # One DP table at full capacity serves both scenarios:
+            # read dp[n][remaining_cap] for the fragile-constrained one
+            dp, take = _solve_knapsack(tuple(std_sizes.tolist()), truck_capacity)
+
+            if fragile_total_size > 0 and fragile_total_size <= truck_capacity:
+                remaining_cap = truck_capacity - fragile_total_size
+                best_std_size = int(dp[remaining_cap])
+
+                total_size_1 = fragile_total_size + best_std_size
+                if total_size_1 > best_scenario["size"]:
+                    chosen = reconstruct(take, std_sizes, remaining_cap)
+                    best_scenario = {"size": total_size_1, "selection": fragile + [standard[i] for i in chosen]}
+
+            best_std_size_only = int(dp[truck_capacity])
+
+            if best_std_size_only > best_scenario["size"]:
+                chosen = reconstruct(take, std_sizes, truck_capacity)
+                best_scenario = {
+                    "size": best_std_size_only,
+                    "selection": [standard[i] for i in chosen]
+                }
 
         execution_logs = []
-        for pkg_data in best_scenario['selection']:
-            tsize = pkg_data.get('size')
-            tid = pkg_data.get('tracking_id')
-            if tid:
-                bin_freed = self._free_bin_for_package(tid)
-
-                self.truck.load(tid,tsize)
-                
-                status_msg = "Moved from Bin to Truck" if bin_freed else "Loaded to Truck (was not in bin)"
-                execution_logs.append(f"{tid}: {status_msg}")
-
-                ShipmentLog.objects.create(
-                    tracking_id=tid,
-                    status='LOADED',
-                    details=f"{status_msg} (Optimization)"
-                )
+        shipment_logs = []
+        selected_ids = [p['tracking_id'] for p in best_scenario['selection'] if p.get('tracking_id')]
+
+        with transaction.atomic():
+            # Free all selected bins in one SELECT + one UPDATE instead of
+            # a per-package _free_bin_for_package round-trip
+            freed_bins = list(
+                StorageBin.objects.filter(current_package_id__in=selected_ids)
+                .values('bin_id', 'capacity', 'location_code', 'current_package_id')
+            )
+            StorageBin.objects.filter(current_package_id__in=selected_ids) \
+                .update(is_occupied=False, current_package=None)
+            freed_ids = {b['current_package_id'] for b in freed_bins}
+
+            for pkg_data in best_scenario['selection']:
+                tsize = pkg_data.get('size')
+                tid = pkg_data.get('tracking_id')
+                if tid:
+                    self.truck.load(tid,tsize)
+
+                    status_msg = "Moved from Bin to Truck" if tid in freed_ids else "Loaded to Truck (was not in bin)"
+                    execution_logs.append(f"{tid}: {status_msg}")
+
+                    shipment_logs.append(ShipmentLog(
+                        tracking_id=tid,
+                        status='LOADED',
+                        details=f"{status_msg} (Optimization)"
+                    ))
+
+            # Restore the freed bins to the sorted in-memory inventory
+            for b in freed_bins:
+                restored_bin = InMemoryBin(b['bin_id'], b['capacity'], b['location_code'])
+                self.bin_inventory.add(restored_bin)
+
+            # One batched INSERT instead of one round-trip per package
+            ShipmentLog.objects.bulk_create(shipment_logs, batch_size=500)
 
         best_scenario['execution_logs'] = execution_logs
         return best_scenario
 
     def _find_max_subset(self, capacity, items):
-        if capacity == 0 or not items:
+        """ 0/1 Knapsack via the JIT-compiled kernel in _knapsack.py. """
+        if capacity <= 0 or not items:
             return 0, []
-
-        current_item = items[0]
-        remaining_items = items[1:]
-        
-        size_without, pkg_without = self._find_max_subset(capacity, remaining_items)
-        
-        size_with = 0
-        pkg_with = []
-        if current_item['size'] <= capacity:
-            sub_size, sub_pkg = self._find_max_subset(capacity - current_item['size'], remaining_items)
-            size_with = current_item['size'] + sub_size
-            pkg_with = [current_item] + sub_pkg
-
-        if size_with > size_without:
-            return size_with, pkg_with
-        else:
-            return size_without, pkg_without
+        sizes = np.array([p['size'] for p in items], dtype=np.int32)
+        dp, take = knapsack(sizes, capacity)
+        chosen = reconstruct(take, sizes, capacity)
+        return int(dp[capacity]), [items[i] for i in chosen]
 
     def _free_bin_for_package(self, tracking_id):
         """
-        Finds the bin containing the package using current_tracking_id, 
+        Finds the bin containing the package using the current_package FK,
         frees it in DB, and adds it back to the sorted memory list.
         """
         try:
-            db_bin = StorageBin.objects.get(current_tracking_id=tracking_id)
-            
+            # Only pull the columns this routine actually touches
+            db_bin = StorageBin.objects.only(
+                'bin_id', 'capacity', 'location_code', 'is_occupied', 'current_package'
+            ).get(current_package_id=tracking_id)
+
             if db_bin.is_occupied:
                 db_bin.is_occupied = False
-                db_bin.current_tracking_id = None
-                db_bin.save()
+                db_bin.current_package = None
+                db_bin.save(update_fields=['is_occupied', 'current_package'])
 
                 restored_bin = InMemoryBin(db_bin.bin_id, db_bin.capacity, db_bin.location_code)
-                bisect.insort(self.bin_inventory, restored_bin)
+                self.bin_inventory.add(restored_bin)
                 return True
         except StorageBin.DoesNotExist:
             pass
@@ -297,6 +372,7 @@ class LogiMaster:
 
         if self.truck.load(pkg.tracking_id, pkg.size):
             ShipmentLog.objects.create(tracking_id=tracking_id, status='LOADED')
+            _solve_knapsack.cache_clear() # Truck contents changed
             return f"Loaded {tracking_id} (Size: {pkg.size})"
         else:
             return "Error: Truck is full."
@@ -305,29 +381,40 @@ class LogiMaster:
     def rollback_load(self, target_tracking_id):
         """ Remove specific package from truck using stack
         First unload the truck until did't find the traget package and remove package then reload the truck"""
-        if not any(item['id'] == target_tracking_id for item in self.truck.stack):
+        if isinstance(target_tracking_id, str):
+            try:
+                target_tracking_id = uuid.UUID(target_tracking_id)
+            except ValueError:
+                return [f"Error: Item {target_tracking_id} is not a valid tracking ID."]
+
+        if target_tracking_id not in self.truck.id_set:
              return [f"Error: Item {target_tracking_id} not found on truck."]
 
         temp_storage = []
         action_log = []
+        shipment_logs = []
 
         while self.truck.stack:
             item = self.truck.pop()
-            current_id = item['id']
-            
+            current_id = item.id
+
             if current_id == target_tracking_id:
-                ShipmentLog.objects.create(tracking_id=current_id, status='UNLOADED', details="Target item removed via Rollback")
+                shipment_logs.append(ShipmentLog(tracking_id=current_id, status='UNLOADED', details="Target item removed via Rollback"))
                 action_log.append(f"TARGET REMOVED: {current_id}")
                 break
             else:
                 temp_storage.append(item)
-                ShipmentLog.objects.create(tracking_id=current_id, status='UNLOADED', details="Temporarily unloaded")
+                shipment_logs.append(ShipmentLog(tracking_id=current_id, status='UNLOADED', details="Temporarily unloaded"))
                 action_log.append(f"Temporarily Unloaded: {current_id}")
 
         while temp_storage:
             item = temp_storage.pop()
-            self.truck.load(item['id'], item['size'])
-            ShipmentLog.objects.create(tracking_id=item['id'], status='LOADED', details="Reloaded after rollback")
-            action_log.append(f"Reloaded: {item['id']}")
+            self.truck.load(item.id, item.size)
+            shipment_logs.append(ShipmentLog(tracking_id=item.id, status='LOADED', details="Reloaded after rollback"))
+            action_log.append(f"Reloaded: {item.id}")
+
+        # Flush the audit trail in one batched INSERT
+        ShipmentLog.objects.bulk_create(shipment_logs, batch_size=500)
 
+        _solve_knapsack.cache_clear() # Truck contents changed
         return action_log
\ No newline at end of file
@@ -0,0 +1,41 @@
+"""
+JIT-compiled 0/1 Knapsack kernel for LogiMaster's truck-loading optimizer.
+Numba compiles the double loop to machine code on first use; cache=True
+persists the compiled kernel across processes.
+"""
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def knapsack(sizes, capacity):
+    """Bottom-up 0/1 Knapsack over a contiguous int32 sizes array.
+    Returns (dp, take): dp[c] is the best fillable size within capacity c
+    after all items; take[i, c] marks where the 'with item i' branch won."""
+    n = sizes.shape[0]
+    dp = np.zeros(capacity + 1, np.int32)
+    take = np.zeros((n, capacity + 1), np.bool_)
+
+    for i in range(n):
+        s = sizes[i]
+        for c in range(capacity, s - 1, -1):
+            v = dp[c - s] + s
+            if v > dp[c]:
+                dp[c] = v
+                take[i, c] = True
+
+    return dp, take
+
+
+def reconstruct(take, sizes, capacity):
+    """Walk the take matrix backwards from the target capacity;
+    returns the indices of the chosen items."""
+    chosen = []
+    c = capacity
+    for i in range(sizes.shape[0] - 1, -1, -1):
+        if take[i, c]:
+            chosen.append(i)
+            c -= int(sizes[i])
+
+    chosen.reverse()
+    return chosen
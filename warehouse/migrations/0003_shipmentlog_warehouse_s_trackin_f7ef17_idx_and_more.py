@@ -0,0 +1,25 @@
+# Generated by Django 5.2.8 on 2026-08-28 07:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('warehouse', '0002_alter_package_tracking_id_alter_storagebin_bin_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='shipmentlog',
+            index=models.Index(fields=['tracking_id'], name='warehouse_s_trackin_f7ef17_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='storagebin',
+            index=models.Index(fields=['is_occupied', 'capacity'], name='warehouse_s_is_occu_e6cffe_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='storagebin',
+            index=models.Index(fields=['current_tracking_id'], name='warehouse_s_current_8a5d4d_idx'),
+        ),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 5.2.8 on 2026-08-28 07:34
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+# Fixed namespace for ShipmentLog rows whose package no longer exists:
+# uuid5 hashing keeps logs sharing a legacy ID correlated after the swap.
+LEGACY_ID_NAMESPACE = uuid.UUID('c7a9f3d0-5b0e-4f7a-9c81-2d64f1f0b7aa')
+
+
+def backfill_tracking_uuids(apps, schema_editor):
+    """Rewrite legacy 'PKG-XXXXXXXX' string IDs as UUID hex strings
+    (still inside the CharField columns) so the type changes below can
+    cast them, remapping bins and logs through the same mapping.
+    Undashed hex is what UUIDField stores on non-native backends and
+    what Postgres' ::uuid cast accepts, so both conversions line up."""
+    Package = apps.get_model('warehouse', 'Package')
+    StorageBin = apps.get_model('warehouse', 'StorageBin')
+    ShipmentLog = apps.get_model('warehouse', 'ShipmentLog')
+
+    mapping = {
+        old_id: uuid.uuid4().hex
+        for old_id in Package.objects.values_list('tracking_id', flat=True)
+    }
+    for old_id, new_id in mapping.items():
+        Package.objects.filter(tracking_id=old_id).update(tracking_id=new_id)
+
+    for bin_row in StorageBin.objects.exclude(current_tracking_id__isnull=True):
+        new_id = mapping.get(bin_row.current_tracking_id)
+        if new_id is None:
+            # The package is gone: release the bin instead of leaving it
+            # occupied-but-empty after the old column is dropped
+            bin_row.current_tracking_id = None
+            bin_row.is_occupied = False
+        else:
+            bin_row.current_tracking_id = new_id
+        bin_row.save(update_fields=['current_tracking_id', 'is_occupied'])
+
+    logs = list(ShipmentLog.objects.all())
+    for log in logs:
+        log.tracking_id = mapping.get(
+            log.tracking_id,
+            uuid.uuid5(LEGACY_ID_NAMESPACE, log.tracking_id).hex
+        )
+    ShipmentLog.objects.bulk_update(logs, ['tracking_id'], batch_size=500)
+
+
+def link_bins_to_packages(apps, schema_editor):
+    """Copy the (now UUID-string) current_tracking_id values into the new
+    current_package FK before the old column is dropped."""
+    StorageBin = apps.get_model('warehouse', 'StorageBin')
+    for bin_row in StorageBin.objects.exclude(current_tracking_id__isnull=True):
+        bin_row.current_package_id = uuid.UUID(bin_row.current_tracking_id)
+        bin_row.save(update_fields=['current_package'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('warehouse', '0003_shipmentlog_warehouse_s_trackin_f7ef17_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='storagebin',
+            name='warehouse_s_current_8a5d4d_idx',
+        ),
+        migrations.RunPython(backfill_tracking_uuids, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='package',
+            name='tracking_id',
+            field=models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='shipmentlog',
+            name='tracking_id',
+            field=models.UUIDField(),
+        ),
+        migrations.AddField(
+            model_name='storagebin',
+            name='current_package',
+            field=models.ForeignKey(blank=True, help_text='Package currently stored in this bin', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='warehouse.package'),
+        ),
+        migrations.RunPython(link_bins_to_packages, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='storagebin',
+            name='current_tracking_id',
+        ),
+    ]
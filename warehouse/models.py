@@ -3,18 +3,18 @@ from django.utils import timezone
 import uuid
 
 def generate_tracking_id():
-    """Generates a unique tracking ID like PKG-1A2B3C4D"""
+    """Legacy default kept only because old migrations reference it."""
     return f"PKG-{str(uuid.uuid4())[:8].upper()}"
 
 class Package(models.Model):
     """
     Represents an package item in the system.
     """
-    tracking_id = models.CharField(
+    # Native UUID (16 bytes) instead of a 100-char string: smaller
+    # indexes and faster joins against bins and shipment logs
+    tracking_id = models.UUIDField(
         primary_key=True,
-        max_length=100, 
-        unique=True, 
-        default=generate_tracking_id, 
+        default=uuid.uuid4,
         editable=False
     )
     size = models.IntegerField()
@@ -22,7 +22,7 @@ class Package(models.Model):
     is_fragile = models.BooleanField(default=False, help_text="Handle with care if True")
 
     def __str__(self):
-        return f"{self.tracking_id} (Size: {self.size})"
+        return f"PKG-{str(self.tracking_id)[:8].upper()} (Size: {self.size})"
 
 class StorageBin(models.Model):
     """
@@ -33,17 +33,23 @@ class StorageBin(models.Model):
     location_code = models.CharField(max_length=50, unique=True)
     capacity = models.IntegerField(help_text="Volume capacity of the bin")
     is_occupied = models.BooleanField(default=False)
-    current_tracking_id = models.CharField(
-        max_length=100, 
-        null=True, 
-        blank=True, 
-        help_text="Tracking ID of the package currently in this bin"
+    current_package = models.ForeignKey(
+        Package,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='+',
+        help_text="Package currently stored in this bin"
     )
 
     class Meta:
         ordering = ['capacity']
         indexes = [
             models.Index(fields=['capacity']),
+            # Covers reload_inventory (is_occupied=False ORDER BY capacity)
+            # and the occupied-bin scan in optimize_truck_loading
+            models.Index(fields=['is_occupied', 'capacity']),
+            # current_package lookups are covered by the FK's own index
         ]
 
     def __str__(self):
@@ -61,11 +67,16 @@ class ShipmentLog(models.Model):
         ('ERROR', 'Error'),
     ]
 
-    tracking_id = models.CharField(max_length=50)
+    tracking_id = models.UUIDField()
     bin_id = models.CharField(max_length=50, null=True, blank=True)
     timestamp = models.DateTimeField(default=timezone.now)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES)
     details = models.TextField(blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['tracking_id']),
+        ]
+
     def __str__(self):
         return f"[{self.timestamp}] {self.tracking_id} - {self.status}"
\ No newline at end of file
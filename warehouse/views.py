@@ -1,11 +1,18 @@
+from django.db import transaction
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
+import functools
 import json
 from .Logistech_Engine import LogiMaster
 from .models import StorageBin
 
 
-controller = LogiMaster()
+@functools.lru_cache(maxsize=1)
+def get_controller():
+    """Lazy, thread-safe access to the LogiMaster singleton.
+    Constructing it on first request keeps the DB query out of app import
+    (one per gunicorn worker, possibly before the DB is ready)."""
+    return LogiMaster()
 
 @csrf_exempt
 def ingest(request):
@@ -13,7 +20,7 @@ def ingest(request):
     if request.method == 'POST':
         data = json.loads(request.body)
         # UPDATED: No tracking_id passed here
-        msg = controller.ingest_package(
+        msg = get_controller().ingest_package(
             size=int(data.get('size')), 
             destination=data.get('destination'),
             is_fragile=data.get('is_fragile', False)
@@ -26,38 +33,39 @@ def generate_bins(request):
     Helper to populate DB with dummy bins representing real warehouse locations.
     """
     import random
-    StorageBin.objects.all().delete()
-    
+
     sizes = [5, 10, 15, 20, 50, 100, 200]
-    
+
     # Generate realistic warehouse grid: Aisles, Shelves, Levels
     aisles = 4
-    sections = 5 
+    sections = 5
     levels = 3
-    
-    created_count = 0
-    
-    for a in range(1, aisles + 1):
-        for s in range(1, sections + 1):
-            for l in range(1, levels + 1):
-                # Example: "Aisle-01-Sect-02-Lvl-1"
-                loc_code = f"Aisle-{a:02d}-Sect-{s:02d}-Lvl-{l}"
-                
-                # Note: 'bin_id' is an AutoField in models.py, so Postgres 
-                # automatically assigns ID 1, 2, 3... we don't pass it here.
-                StorageBin.objects.create(
-                    location_code=loc_code,
-                    capacity=random.choice(sizes)
-                )
-                created_count += 1
 
-    controller.reload_inventory() # Sync Singleton with new DB data
-    return JsonResponse({'status': f'Created {created_count} bins with realistic warehouse locations.'})
+    # Note: 'bin_id' is an AutoField in models.py, so Postgres
+    # automatically assigns ID 1, 2, 3... we don't pass it here.
+    # Example location_code: "Aisle-01-Sect-02-Lvl-1"
+    bins = [
+        StorageBin(
+            location_code=f"Aisle-{a:02d}-Sect-{s:02d}-Lvl-{l}",
+            capacity=random.choice(sizes)
+        )
+        for a in range(1, aisles + 1)
+        for s in range(1, sections + 1)
+        for l in range(1, levels + 1)
+    ]
+
+    # One commit for the whole rebuild: wipe + single batched INSERT
+    with transaction.atomic():
+        StorageBin.objects.all().delete()
+        StorageBin.objects.bulk_create(bins, batch_size=500)
+
+    get_controller().reload_inventory() # Sync Singleton with new DB data
+    return JsonResponse({'status': f'Created {len(bins)} bins with realistic warehouse locations.'})
 
 @csrf_exempt
 def process_queue(request):
     """GET: Trigger the 'Best Fit' algorithm for the next item"""
-    msg = controller.process_next_item()
+    msg = get_controller().process_next_item()
     return JsonResponse({'result': msg})
 
 @csrf_exempt
@@ -71,7 +79,7 @@ def optimize_load(request):
         data = json.loads(request.body)
         capacity = data.get('capacity')
         
-        optimization_result = controller.optimize_truck_loading(capacity)
+        optimization_result = get_controller().optimize_truck_loading(capacity)
         
         return JsonResponse({
             'truck_capacity': capacity,
@@ -90,11 +98,12 @@ def unload_truck(request):
     if request.method == 'POST':
         data = json.loads(request.body)
         tid = data.get('tracking_id')
-        logs = controller.rollback_load(tid)
+        logs = get_controller().rollback_load(tid)
         return JsonResponse({'status': 'processed', 'actions_taken': logs})
 
 def view_status(request):
     """GET: View internal state of Conveyor and Stack"""
+    controller = get_controller()
     return JsonResponse({
         'conveyor_count': len(controller.conveyor_queue),
         'stack_count': len(controller.truck.stack),